@@ -0,0 +1,3 @@
+from sicrmlb.dataset.shards import ShardedDataset, ShardWriter, merge_indices
+
+__all__ = ["ShardedDataset", "ShardWriter", "merge_indices"]
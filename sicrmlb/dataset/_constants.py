@@ -0,0 +1,5 @@
+INDEX_FILENAME = "index.json"
+SHARD_PREFIX = "shard"
+
+DEFAULT_SHARD_SIZE = 512
+DEFAULT_MAX_SHARD_BYTES = 32 * 2**20  # Buffered per writer, i.e. per extraction worker
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from sicrmlb.utils.types import FieldSpec
+
+
+class ShardInfo(BaseModel):
+    name: str
+    length: int
+    source: str | None = None
+    starts_on_keyframe: bool = True
+
+
+class DatasetIndex(BaseModel):
+    fields: dict[str, FieldSpec] = {}
+    shards: list[ShardInfo] = []
+
+    @property
+    def length(self) -> int:
+        return sum(shard.length for shard in self.shards)
@@ -0,0 +1,200 @@
+import logging
+import numpy as np
+from pathlib import Path
+from typing import Iterator
+
+from sicrmlb.dataset._constants import (
+    DEFAULT_MAX_SHARD_BYTES,
+    DEFAULT_SHARD_SIZE,
+    INDEX_FILENAME,
+    SHARD_PREFIX,
+)
+from sicrmlb.utils.types import FieldSpec
+from sicrmlb.dataset._types import DatasetIndex, ShardInfo
+
+logger = logging.getLogger(__name__)
+
+
+def shard_path(root: Path, shard: str, field: str) -> Path:
+    """Get the path of the .npy file holding `field` for `shard`."""
+    return root / f"{shard}_{field}.npy"
+
+
+class ShardWriter:
+    """Buffers samples in preallocated arrays and writes them out as .npy shards plus an index.
+
+    The buffer holds `max_shard_size` samples, or fewer if those would take
+    more than `max_shard_bytes`; appending to a full buffer flushes it first,
+    so callers choosing their own shard boundaries cannot grow it without bound.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        source: str | None = None,
+        max_shard_size: int = DEFAULT_SHARD_SIZE,
+        max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+    ):
+        self.directory = Path(directory)
+        self.source = source
+        self.max_shard_size = max_shard_size
+        self.max_shard_bytes = max_shard_bytes
+        self.index = DatasetIndex()
+
+        self._buffer: dict[str, np.ndarray] = {}
+        self._capacity = max_shard_size
+        self._pending = 0
+        self._starts_on_keyframe = True
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples a shard can hold; known once the first sample is appended."""
+        return self._capacity
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered samples not yet written to a shard."""
+        return self._pending
+
+    def append(self, sample: dict[str, np.ndarray], keyframe: bool = True) -> None:
+        """Buffer a single sample. Every sample must have the same fields, dtypes and shapes.
+
+        `keyframe` marks whether the sample opens a GOP; it is recorded on the
+        shard the sample starts, if any.
+        """
+        if not self.index.fields:
+            self.index.fields = {
+                name: FieldSpec(dtype=str(np.asarray(value).dtype), shape=list(np.shape(value)))
+                for name, value in sample.items()
+            }
+            sample_bytes = sum(np.asarray(value).nbytes for value in sample.values())
+            self._capacity = max(1, min(self.max_shard_size, self.max_shard_bytes // sample_bytes))
+            self._buffer = {
+                name: np.empty((self._capacity, *spec.shape), dtype=spec.dtype)
+                for name, spec in self.index.fields.items()
+            }
+
+        if sample.keys() != self.index.fields.keys():
+            raise ValueError(
+                f"Sample fields {sorted(sample)} do not match dataset fields "
+                f"{sorted(self.index.fields)}."
+            )
+
+        if self._pending == self._capacity:
+            self.flush()
+        if self._pending == 0:
+            self._starts_on_keyframe = keyframe
+
+        for name, value in sample.items():
+            self._buffer[name][self._pending] = value
+        self._pending += 1
+
+    def flush(self) -> ShardInfo | None:
+        """Write the buffered samples as a new shard."""
+        length = self._pending
+        if length == 0:
+            return None
+
+        name = f"{SHARD_PREFIX}_{len(self.index.shards):05d}"
+        for field, values in self._buffer.items():
+            np.save(shard_path(self.directory, name, field), values[:length])
+        self._pending = 0
+
+        shard = ShardInfo(
+            name=name,
+            length=length,
+            source=self.source,
+            starts_on_keyframe=self._starts_on_keyframe,
+        )
+        self.index.shards.append(shard)
+        logger.debug(f"Wrote shard {name} with {length} samples to {self.directory}.")
+        return shard
+
+    def close(self) -> DatasetIndex:
+        """Flush any remaining samples and write the index file."""
+        self.flush()
+        (self.directory / INDEX_FILENAME).write_text(
+            self.index.model_dump_json(indent=2), encoding="utf-8"
+        )
+        return self.index
+
+
+def merge_indices(root: Path, directories: list[Path]) -> DatasetIndex:
+    """Combine the indices of several shard directories under `root` into one index."""
+    root = Path(root)
+    merged = DatasetIndex()
+    for directory in directories:
+        index_file = Path(directory) / INDEX_FILENAME
+        index = DatasetIndex.model_validate_json(index_file.read_text(encoding="utf-8"))
+        if not index.shards:
+            continue
+        if not merged.fields:
+            merged.fields = index.fields
+        elif index.fields != merged.fields:
+            raise ValueError(f"Fields of {index_file} do not match the other shards.")
+
+        prefix = Path(directory).relative_to(root).as_posix()
+        for shard in index.shards:
+            merged.shards.append(shard.model_copy(update={"name": f"{prefix}/{shard.name}"}))
+
+    (root / INDEX_FILENAME).write_text(merged.model_dump_json(indent=2), encoding="utf-8")
+    return merged
+
+
+class ShardedDataset:
+    """Read-only view over a shard directory; shards are memory-mapped on first access."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.index = DatasetIndex.model_validate_json(
+            (self.root / INDEX_FILENAME).read_text(encoding="utf-8")
+        )
+        self._offsets = np.cumsum([0] + [shard.length for shard in self.index.shards])
+        self._arrays: dict[tuple[int, str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def __getitem__(self, idx: int) -> dict[str, np.ndarray]:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Index {idx} out of range for dataset of size {len(self)}.")
+        shard = int(np.searchsorted(self._offsets, idx, side="right")) - 1
+        local = idx - int(self._offsets[shard])
+        return {field: self.get_shard(shard, field)[local] for field in self.index.fields}
+
+    def get_shard(self, shard: int, field: str) -> np.ndarray:
+        """Get the memory-mapped array holding `field` for the shard at position `shard`."""
+        key = (shard, field)
+        if key not in self._arrays:
+            self._arrays[key] = np.load(
+                shard_path(self.root, self.index.shards[shard].name, field), mmap_mode="r"
+            )
+        return self._arrays[key]
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        fields: list[str] | None = None,
+        shuffle: bool = False,
+        seed: int | None = None,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """Stream batches shard by shard so only one shard is paged in at a time."""
+        fields = fields or list(self.index.fields)
+        rng = np.random.default_rng(seed)
+        order = np.arange(len(self.index.shards))
+        if shuffle:
+            rng.shuffle(order)
+
+        for shard in order:
+            length = self.index.shards[shard].length
+            rows = rng.permutation(length) if shuffle else np.arange(length)
+            for start in range(0, length, batch_size):
+                # Sorted rows keep the reads from the memory map sequential.
+                batch_rows = np.sort(rows[start : start + batch_size])
+                yield {
+                    field: np.asarray(self.get_shard(int(shard), field)[batch_rows])
+                    for field in fields
+                }
@@ -0,0 +1,18 @@
+# Digit OCR: glyph windows are matched at this size after scaling each ROI
+# to GLYPH_HEIGHT rows.
+GLYPH_HEIGHT = 16
+GLYPH_WIDTH = 12
+
+MIN_GLYPH_SCORE = 0.6
+MIN_GLYPH_SPACING = 0.7  # Fraction of GLYPH_WIDTH between two accepted glyphs
+MAX_UNCOVERED_COLUMNS = 3  # Text columns outside every matched glyph before a read is rejected
+
+# An ROI only holds text if it has both a dark outline and a light fill pixel.
+TEXT_MAX_OUTLINE = 30
+TEXT_MIN_FILL = 150
+
+FINGERPRINT_SHIFT = 5  # Drop low bits so most compression noise keeps the same fingerprint
+PIXEL_JITTER = 8  # Largest per-pixel difference still treated as the same ROI
+RECENT_ROIS = 8
+
+OCR_CACHE_SIZE = 256
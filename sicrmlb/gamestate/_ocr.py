@@ -0,0 +1,244 @@
+import cv2
+import hashlib
+import logging
+import numpy as np
+from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict, deque
+from numpy.lib.stride_tricks import sliding_window_view
+
+from sicrmlb.gamestate._constants import (
+    FINGERPRINT_SHIFT,
+    GLYPH_HEIGHT,
+    GLYPH_WIDTH,
+    MAX_UNCOVERED_COLUMNS,
+    MIN_GLYPH_SCORE,
+    MIN_GLYPH_SPACING,
+    OCR_CACHE_SIZE,
+    PIXEL_JITTER,
+    RECENT_ROIS,
+    TEXT_MAX_OUTLINE,
+    TEXT_MIN_FILL,
+)
+
+logger = logging.getLogger(__name__)
+
+DIGITS = "0123456789"
+
+
+def to_gray(roi: np.ndarray) -> np.ndarray:
+    """Collapse an RGB ROI to its darkest channel.
+
+    In-game numbers are light text with a dark outline over a coloured
+    background, which the minimum channel separates regardless of the colour.
+    """
+    return roi.min(axis=2) if roi.ndim == 3 else roi
+
+
+def to_glyph_rows(gray: np.ndarray) -> np.ndarray:
+    """Scale a grayscale ROI to GLYPH_HEIGHT rows, keeping its aspect ratio."""
+    width = max(GLYPH_WIDTH, round(gray.shape[1] * GLYPH_HEIGHT / gray.shape[0]))
+    return cv2.resize(
+        gray.astype(np.float32), (width, GLYPH_HEIGHT), interpolation=cv2.INTER_LINEAR
+    )
+
+
+def _normalize(windows: np.ndarray) -> np.ndarray:
+    flat = windows.reshape(len(windows), -1).astype(np.float32)
+    flat -= flat.mean(axis=1, keepdims=True)
+    return flat / (np.linalg.norm(flat, axis=1, keepdims=True) + 1e-6)
+
+
+class DigitTemplateBank:
+    """One GLYPH_HEIGHT x GLYPH_WIDTH template per digit.
+
+    `learned` marks the digits whose template was cut from real game frames.
+    The others are rendered placeholders: they still take part in matching so
+    their glyphs are not mistaken for another digit, but a read that lands on
+    one is rejected.
+    """
+
+    def __init__(self, templates: np.ndarray, learned: np.ndarray | None = None):
+        if templates.shape != (len(DIGITS), GLYPH_HEIGHT, GLYPH_WIDTH):
+            raise ValueError(
+                f"Expected templates of shape {(len(DIGITS), GLYPH_HEIGHT, GLYPH_WIDTH)}, "
+                f"got {templates.shape}."
+            )
+        self.templates = templates.astype(np.float32)
+        self.learned = (
+            np.ones(len(DIGITS), dtype=bool) if learned is None else np.asarray(learned, dtype=bool)
+        )
+        self._normalized = _normalize(self.templates)
+
+    @classmethod
+    def render(cls) -> "DigitTemplateBank":
+        """Render the digits with an OpenCV font. Only a fallback for missing glyphs."""
+        thickness = 3
+        templates = np.zeros((len(DIGITS), GLYPH_HEIGHT, GLYPH_WIDTH), dtype=np.float32)
+        for i, digit in enumerate(DIGITS):
+            (w, h), baseline = cv2.getTextSize(digit, cv2.FONT_HERSHEY_TRIPLEX, 1.0, thickness)
+            pad = thickness + 2
+            canvas = np.zeros((h + baseline + 2 * pad, w + 2 * pad), dtype=np.uint8)
+            cv2.putText(
+                canvas, digit, (pad, h + pad), cv2.FONT_HERSHEY_TRIPLEX, 1.0, 255, thickness
+            )
+            ys, xs = np.nonzero(canvas)
+            glyph = canvas[ys.min() : ys.max() + 1, xs.min() : xs.max() + 1]
+            width = min(GLYPH_WIDTH, max(1, round(glyph.shape[1] * GLYPH_HEIGHT / glyph.shape[0])))
+            offset = (GLYPH_WIDTH - width) // 2
+            templates[i, :, offset : offset + width] = cv2.resize(
+                glyph, (width, GLYPH_HEIGHT), interpolation=cv2.INTER_AREA
+            )
+        return cls(templates, learned=np.zeros(len(DIGITS), dtype=bool))
+
+    @classmethod
+    def from_samples(
+        cls, samples: list[tuple[np.ndarray, str]], base: "DigitTemplateBank | None" = None
+    ) -> "DigitTemplateBank":
+        """Average glyphs cut from labelled ROIs; digits without samples keep `base`'s template.
+
+        Each ROI should be cropped around the text only. The text's columns are
+        split evenly between its characters.
+        """
+        base = base or cls.render()
+        sums = np.zeros_like(base.templates)
+        counts = np.zeros(len(DIGITS), dtype=np.int64)
+        for roi, text in samples:
+            rows = to_glyph_rows(to_gray(roi))
+            _, mask = cv2.threshold(
+                rows.astype(np.uint8), 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+            )
+            columns = np.nonzero(mask.any(axis=0))[0]
+            start, end = columns.min(), columns.max() + 1
+            pitch = (end - start) / len(text)
+            for i, char in enumerate(text):
+                center = start + pitch * (i + 0.5)
+                left = min(max(round(center - GLYPH_WIDTH / 2), 0), rows.shape[1] - GLYPH_WIDTH)
+                sums[int(char)] += rows[:, left : left + GLYPH_WIDTH]
+                counts[int(char)] += 1
+
+        templates = base.templates.copy()
+        seen = counts > 0
+        templates[seen] = sums[seen] / counts[seen, None, None]
+        return cls(templates, learned=base.learned | seen)
+
+    @classmethod
+    def load(cls, path: Path) -> "DigitTemplateBank":
+        with np.load(path) as bank:
+            return cls(bank["templates"], learned=bank["learned"])
+
+    def save(self, path: Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, templates=self.templates, learned=self.learned)
+
+    def match(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Score every template at every horizontal position of `rows` in one product.
+
+        Returns the best digit and its normalized cross-correlation per position.
+        """
+        windows = sliding_window_view(rows, (GLYPH_HEIGHT, GLYPH_WIDTH))[0]
+        scores = _normalize(windows) @ self._normalized.T
+        return scores.argmax(axis=1), scores.max(axis=1)
+
+
+@lru_cache(maxsize=None)
+def load_template_bank(path: Path) -> DigitTemplateBank:
+    """Load a template bank once per process, falling back to rendered digits."""
+    if not path.exists():
+        logger.warning(f"Digit templates not found at {path}, using rendered digits.")
+        return DigitTemplateBank.render()
+    return DigitTemplateBank.load(path)
+
+
+class DigitReader:
+    """Reads a run of digits from an ROI, caching results by the ROI's pixels.
+
+    The cache is keyed by the ROI with its low FINGERPRINT_SHIFT bits dropped.
+    A compression jitter that pushes a pixel across a bucket boundary changes
+    that key. Each miss is therefore also compared against the last
+    RECENT_ROIS ROIs that were matched, and reuses their text when no pixel
+    differs by more than PIXEL_JITTER.
+    """
+
+    def __init__(self, bank: DigitTemplateBank, cache_size: int = OCR_CACHE_SIZE):
+        self.bank = bank
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+        self._cache: OrderedDict[bytes, str | None] = OrderedDict()
+        self._recent: deque[tuple[np.ndarray, str | None]] = deque(maxlen=RECENT_ROIS)
+
+    def read(self, roi: np.ndarray) -> str | None:
+        """Read the digits in `roi`.
+
+        Returns an empty string when the ROI holds no outlined text, and None
+        when the text contains a digit the bank has no real template for or
+        glyphs that no template matched.
+        """
+        gray = to_gray(roi)
+        key = self._fingerprint(gray)
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        found, text = self._find_recent(gray)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+            text = self._match(gray)
+            self._recent.append((gray.astype(np.int16), text))
+
+        self._cache[key] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def _find_recent(self, gray: np.ndarray) -> tuple[bool, str | None]:
+        for previous, text in self._recent:
+            if previous.shape == gray.shape and np.abs(previous - gray).max() <= PIXEL_JITTER:
+                return True, text
+        return False, None
+
+    def _match(self, gray: np.ndarray) -> str | None:
+        if gray.min() > TEXT_MAX_OUTLINE or gray.max() < TEXT_MIN_FILL:
+            return ""
+        rows = to_glyph_rows(gray)
+        digits, scores = self.bank.match(rows)
+
+        # Greedy non-maximum suppression: keep the best scoring positions that
+        # are at least MIN_GLYPH_SPACING glyph widths apart.
+        min_gap = GLYPH_WIDTH * MIN_GLYPH_SPACING
+        accepted: list[int] = []
+        for position in np.argsort(-scores):
+            if scores[position] < MIN_GLYPH_SCORE:
+                break
+            if all(abs(position - other) >= min_gap for other in accepted):
+                accepted.append(int(position))
+        accepted.sort()
+
+        if not self.bank.learned[digits[accepted]].all():
+            return None
+        if self._uncovered_columns(rows, accepted) > MAX_UNCOVERED_COLUMNS:
+            # Text that no template matched well, e.g. an unlearned digit that
+            # scored too low, would otherwise silently drop out of the number.
+            return None
+        return "".join(DIGITS[digits[position]] for position in accepted)
+
+    @staticmethod
+    def _uncovered_columns(rows: np.ndarray, accepted: list[int]) -> int:
+        _, mask = cv2.threshold(rows.astype(np.uint8), 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        strokes = mask.sum(axis=0) >= GLYPH_HEIGHT // 2
+        covered = np.zeros_like(strokes)
+        for position in accepted:
+            covered[position : position + GLYPH_WIDTH] = True
+        return int((strokes & ~covered).sum())
+
+    @staticmethod
+    def _fingerprint(gray: np.ndarray) -> bytes:
+        quantized = np.ascontiguousarray(gray >> FINGERPRINT_SHIFT)
+        return hashlib.blake2b(
+            quantized.tobytes() + bytes(str(quantized.shape), "ascii"), digest_size=16
+        ).digest()
@@ -0,0 +1,7 @@
+from pathlib import Path
+
+# "M:SS" in the top right corner, read as two ROIs either side of the colon.
+TIMER_MINUTES_BOX = (315, 17, 328, 33)
+TIMER_SECONDS_BOX = (333, 17, 358, 33)
+
+TIMER_DIGIT_TEMPLATES = Path(__file__).parent / "templates" / "digits.npz"
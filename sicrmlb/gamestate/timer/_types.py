@@ -0,0 +1,5 @@
+from sicrmlb.gamestate._base import BaseState
+
+
+class TimerState(BaseState):
+    seconds_left: int | None
@@ -0,0 +1,43 @@
+import logging
+import numpy as np
+from PIL.Image import Image
+from sicrmlb.gamestate._base import BaseDetector
+from sicrmlb.gamestate._ocr import DigitReader, load_template_bank
+from sicrmlb.gamestate.timer._types import TimerState
+from sicrmlb.utils.device._constants import CAPTURE_HEIGHT, CAPTURE_WIDTH
+from sicrmlb.gamestate.timer._constants import (
+    TIMER_DIGIT_TEMPLATES,
+    TIMER_MINUTES_BOX,
+    TIMER_SECONDS_BOX,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TimerDetector(BaseDetector):
+    def __init__(self):
+        self.reader = DigitReader(load_template_bank(TIMER_DIGIT_TEMPLATES))
+
+    def perform_analysis(self, frame: Image) -> TimerState:
+        if frame.width != CAPTURE_WIDTH or frame.height != CAPTURE_HEIGHT:
+            logger.error("Frame size does not match capture dimensions.")
+            raise ValueError("Invalid frame size for timer detection.")
+
+        minutes = self.reader.read(self._crop(frame, TIMER_MINUTES_BOX))
+        seconds = self.reader.read(self._crop(frame, TIMER_SECONDS_BOX))
+        logger.debug(f"Read match timer {minutes!r}:{seconds!r}")
+
+        if (
+            minutes is None
+            or seconds is None
+            or len(minutes) != 1
+            or len(seconds) != 2
+            or int(seconds) >= 60
+        ):
+            return TimerState(seconds_left=None)
+        return TimerState(seconds_left=int(minutes) * 60 + int(seconds))
+
+    @staticmethod
+    def _crop(frame: Image, box: tuple[int, int, int, int]) -> np.ndarray:
+        # Crop before converting so only the ROI pixels are copied.
+        return np.asarray(frame.crop(box).convert("RGB"))
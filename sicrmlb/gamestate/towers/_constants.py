@@ -0,0 +1,13 @@
+from pathlib import Path
+
+# Hit points above each princess tower health bar. King tower hit points are
+# only shown once the tower is damaged, so they are not read yet.
+TOWER_HP_WIDTH = 32
+TOWER_HP_HEIGHT = 9
+
+ENEMY_TOWER_HP_Y = 83
+FRIENDLY_TOWER_HP_Y = 405
+LEFT_TOWER_HP_X = 69
+RIGHT_TOWER_HP_X = 269
+
+TOWER_DIGIT_TEMPLATES = Path(__file__).parent / "templates" / "digits.npz"
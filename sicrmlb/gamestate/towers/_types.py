@@ -0,0 +1,14 @@
+from enum import Enum
+from sicrmlb.gamestate._base import BaseState
+
+
+class TowerPosition(Enum):
+    ENEMY_LEFT = "enemy_left"
+    ENEMY_RIGHT = "enemy_right"
+    FRIENDLY_LEFT = "friendly_left"
+    FRIENDLY_RIGHT = "friendly_right"
+
+
+class TowersState(BaseState):
+    # 0 for a destroyed tower, None when its hit points could not be read.
+    hit_points: dict[TowerPosition, int | None]
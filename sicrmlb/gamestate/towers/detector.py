@@ -0,0 +1,47 @@
+import logging
+import numpy as np
+from PIL.Image import Image
+from sicrmlb.gamestate._base import BaseDetector
+from sicrmlb.gamestate._ocr import DigitReader, load_template_bank
+from sicrmlb.gamestate.towers._types import TowerPosition, TowersState
+from sicrmlb.utils.device._constants import CAPTURE_HEIGHT, CAPTURE_WIDTH
+from sicrmlb.gamestate.towers._constants import (
+    ENEMY_TOWER_HP_Y,
+    FRIENDLY_TOWER_HP_Y,
+    LEFT_TOWER_HP_X,
+    RIGHT_TOWER_HP_X,
+    TOWER_DIGIT_TEMPLATES,
+    TOWER_HP_HEIGHT,
+    TOWER_HP_WIDTH,
+)
+
+logger = logging.getLogger(__name__)
+
+TOWER_HP_ORIGINS = {
+    TowerPosition.ENEMY_LEFT: (LEFT_TOWER_HP_X, ENEMY_TOWER_HP_Y),
+    TowerPosition.ENEMY_RIGHT: (RIGHT_TOWER_HP_X, ENEMY_TOWER_HP_Y),
+    TowerPosition.FRIENDLY_LEFT: (LEFT_TOWER_HP_X, FRIENDLY_TOWER_HP_Y),
+    TowerPosition.FRIENDLY_RIGHT: (RIGHT_TOWER_HP_X, FRIENDLY_TOWER_HP_Y),
+}
+
+
+class TowerDetector(BaseDetector):
+    def __init__(self):
+        self.reader = DigitReader(load_template_bank(TOWER_DIGIT_TEMPLATES))
+
+    def perform_analysis(self, frame: Image) -> TowersState:
+        if frame.width != CAPTURE_WIDTH or frame.height != CAPTURE_HEIGHT:
+            logger.error("Frame size does not match capture dimensions.")
+            raise ValueError("Invalid frame size for tower detection.")
+
+        hit_points = {}
+        for position, (x, y) in TOWER_HP_ORIGINS.items():
+            # Crop before converting so only the ROI pixels are copied.
+            box = (x, y, x + TOWER_HP_WIDTH, y + TOWER_HP_HEIGHT)
+            roi = np.asarray(frame.crop(box).convert("RGB"))
+            text = self.reader.read(roi)
+            # A destroyed tower has no hit points shown; None is only for unreadable text.
+            hit_points[position] = None if text is None else int(text or 0)
+            logger.debug(f"Read {position.value} tower hit points: {hit_points[position]}")
+
+        return TowersState(hit_points=hit_points)
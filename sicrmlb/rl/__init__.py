@@ -0,0 +1,6 @@
+from sicrmlb.rl.inference import InferenceServer
+from sicrmlb.rl.replay import ReplayBuffer
+from sicrmlb.rl.sum_tree import SumTree
+from sicrmlb.rl.vector_env import VectorEnv
+
+__all__ = ["InferenceServer", "ReplayBuffer", "SumTree", "VectorEnv"]
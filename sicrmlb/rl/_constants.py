@@ -0,0 +1,11 @@
+REPLAY_META_FILENAME = "meta.json"
+REPLAY_FIELDS = ("observation", "action", "reward", "done")  # next_observation is derived
+PRIORITY_TREE_FILENAME = "priorities.npy"
+
+DEFAULT_ALPHA = 0.6
+DEFAULT_BETA = 0.4
+PRIORITY_EPSILON = 1e-6
+
+NO_OP_ACTION = (-1, -1)
+
+DEFAULT_MAX_BATCH_WAIT = 0.005
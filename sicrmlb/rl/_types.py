@@ -0,0 +1,24 @@
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+from sicrmlb.utils.types import FieldSpec
+
+
+class ReplayBufferMeta(BaseModel):
+    capacity: int
+    fields: dict[str, FieldSpec]
+    prioritized: bool
+    position: int = 0
+    size: int = 0
+    max_priority: float = 1.0
+
+
+class TransitionBatch(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    observation: np.ndarray
+    action: np.ndarray
+    reward: np.ndarray
+    next_observation: np.ndarray
+    done: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
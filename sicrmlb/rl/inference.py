@@ -0,0 +1,124 @@
+import logging
+import queue
+import threading
+import numpy as np
+from typing import Callable
+from concurrent.futures import Future
+
+from sicrmlb.rl._constants import DEFAULT_MAX_BATCH_WAIT
+
+logger = logging.getLogger(__name__)
+
+Policy = Callable[[np.ndarray], np.ndarray]
+
+
+class InferenceServer:
+    """Runs a batched policy over observations coming from many environments.
+
+    `infer()` evaluates an already stacked batch, e.g. the output of
+    `VectorEnv.step()`. Environments stepped from their own threads can instead
+    `submit()` single observations; a worker thread groups pending requests
+    into batches of up to `max_batch_size`, waiting at most `max_wait` seconds
+    for a batch to fill, and calls the policy once per batch.
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        max_batch_size: int,
+        max_wait: float = DEFAULT_MAX_BATCH_WAIT,
+    ):
+        self.policy = policy
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._requests: queue.Queue[tuple[np.ndarray, Future] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def infer(self, observations: np.ndarray) -> np.ndarray:
+        """Evaluate the policy on a `(num_envs, ...)` batch in a single call."""
+        actions = np.asarray(self.policy(observations))
+        if len(actions) != len(observations):
+            raise ValueError(
+                f"Policy returned {len(actions)} actions for {len(observations)} observations."
+            )
+        return actions
+
+    def submit(self, observation: np.ndarray) -> Future:
+        """Queue one observation; the returned future resolves to its action."""
+        future: Future = Future()
+        with self._lock:
+            if self._worker is None:
+                self._start_worker()
+            self._requests.put((observation, future))
+        return future
+
+    def start(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._start_worker()
+
+    def stop(self) -> None:
+        """Stop the worker once its current batch is done.
+
+        Requests it has not picked up yet fail with RuntimeError.
+        """
+        with self._lock:
+            if self._worker is None:
+                return
+            while True:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is not None and self._claim(request):
+                    request[1].set_exception(RuntimeError("InferenceServer was stopped."))
+            self._requests.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def _start_worker(self) -> None:
+        self._worker = threading.Thread(target=self._serve, name="InferenceServer")
+        self._worker.daemon = True
+        self._worker.start()
+
+    def _serve(self) -> None:
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            batch = [request] if self._claim(request) else []
+            stopping = False
+            while batch and len(batch) < self.max_batch_size:
+                try:
+                    request = self._requests.get(timeout=self.max_wait)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                if self._claim(request):
+                    batch.append(request)
+
+            if batch:
+                self._run_batch(batch)
+            if stopping:
+                return
+
+    @staticmethod
+    def _claim(request: tuple[np.ndarray, Future]) -> bool:
+        """Mark a request's future as running; False if its caller already cancelled it."""
+        return request[1].set_running_or_notify_cancel()
+
+    def _run_batch(self, batch: list[tuple[np.ndarray, Future]]) -> None:
+        observations, futures = zip(*batch)
+        try:
+            actions = self.infer(np.stack(observations))
+        except Exception as e:
+            logger.error(f"Error running policy on batch of {len(batch)}: {e}")
+            for future in futures:
+                future.set_exception(e)
+            return
+        for future, action in zip(futures, actions):
+            future.set_result(action)
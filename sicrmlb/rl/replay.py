@@ -0,0 +1,202 @@
+import logging
+import numpy as np
+from pathlib import Path
+
+from sicrmlb.rl.sum_tree import SumTree
+from sicrmlb.utils.types import FieldSpec
+from sicrmlb.rl._types import ReplayBufferMeta, TransitionBatch
+from sicrmlb.rl._constants import (
+    DEFAULT_ALPHA,
+    DEFAULT_BETA,
+    PRIORITY_EPSILON,
+    PRIORITY_TREE_FILENAME,
+    REPLAY_FIELDS,
+    REPLAY_META_FILENAME,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayBuffer:
+    """Fixed-capacity ring buffer of transitions stored in memory-mapped .npy files.
+
+    Every field is preallocated on disk, so appending is a single row write and
+    sampling is one fancy-indexing read per field. Reopening the same directory
+    resumes from the last `flush()`; `close()` (also run on garbage collection)
+    flushes.
+
+    Each frame is stored once: a transition's `next_observation` is written to
+    the next row's observation, which the following transition of the episode
+    starts from. The newest `next_observation` therefore occupies the oldest
+    row, so at most `capacity - 1` transitions can be sampled. The terminal
+    observation of a `done` transition is overwritten by the next episode's
+    first one, and is returned as zeros.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        capacity: int,
+        observation_shape: tuple[int, ...],
+        action_shape: tuple[int, ...] = (2,),
+        observation_dtype: str = "float32",
+        action_dtype: str = "int16",
+        prioritized: bool = False,
+        alpha: float = DEFAULT_ALPHA,
+    ):
+        if capacity < 2:
+            raise ValueError("Replay buffer capacity must be at least 2.")
+        self.directory = Path(directory)
+        self.alpha = alpha
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        meta = ReplayBufferMeta(
+            capacity=capacity,
+            prioritized=prioritized,
+            fields={
+                "observation": FieldSpec(dtype=observation_dtype, shape=list(observation_shape)),
+                "action": FieldSpec(dtype=action_dtype, shape=list(action_shape)),
+                "reward": FieldSpec(dtype="float32", shape=[]),
+                "done": FieldSpec(dtype="bool", shape=[]),
+            },
+        )
+        meta_file = self.directory / REPLAY_META_FILENAME
+        if meta_file.exists():
+            stored = ReplayBufferMeta.model_validate_json(meta_file.read_text(encoding="utf-8"))
+            if stored.model_dump(include={"capacity", "fields", "prioritized"}) != meta.model_dump(
+                include={"capacity", "fields", "prioritized"}
+            ):
+                raise ValueError(
+                    f"Replay buffer at {self.directory} was created with a different layout."
+                )
+            meta = stored
+            logger.debug(f"Resuming replay buffer at {self.directory} with {meta.size} transitions.")
+        self.meta = meta
+        self.tree = None
+
+        self._arrays = {
+            name: self._open_memmap(f"{name}.npy", (capacity, *spec.shape), spec.dtype)
+            for name, spec in meta.fields.items()
+        }
+        if prioritized:
+            self.tree = SumTree(
+                capacity,
+                self._open_memmap(PRIORITY_TREE_FILENAME, (SumTree.tree_size(capacity),), "float64"),
+            )
+            # Rows appended after the last flush are not part of the buffer,
+            # but their priorities may already have reached the tree on disk.
+            self.tree.tree[self.tree.leaf_offset + meta.size :] = 0.0
+            self.tree.tree[self.tree.leaf_offset + meta.position] = 0.0
+            self.tree.rebuild()
+        self.flush()
+
+    def __del__(self):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of transitions that can be sampled."""
+        return min(self.meta.size, self.capacity - 1)
+
+    @property
+    def capacity(self) -> int:
+        return self.meta.capacity
+
+    def append(
+        self,
+        observation: np.ndarray,
+        action: np.ndarray | tuple[int, int],
+        reward: float,
+        next_observation: np.ndarray,
+        done: bool,
+    ) -> int:
+        """Store a transition, overwriting the oldest one once full. Returns its index.
+
+        Unless the previous transition was `done`, `observation` must be its
+        `next_observation`, which is already stored and is not written again.
+        """
+        idx = self.meta.position
+        following = (idx + 1) % self.capacity
+        if self.meta.size == 0 or self._arrays["done"][idx - 1]:
+            self._arrays["observation"][idx] = observation
+        self._arrays["action"][idx] = action
+        self._arrays["reward"][idx] = reward
+        self._arrays["done"][idx] = done
+        self._arrays["observation"][following] = next_observation
+        if self.tree is not None:
+            # The following row's own transition is lost with its observation.
+            self.tree.update(
+                np.array([idx, following]), np.array([self.meta.max_priority**self.alpha, 0.0])
+            )
+
+        self.meta.position = (idx + 1) % self.capacity
+        self.meta.size = min(self.meta.size + 1, self.capacity)
+        return idx
+
+    def sample(
+        self,
+        batch_size: int,
+        beta: float = DEFAULT_BETA,
+        rng: np.random.Generator | None = None,
+    ) -> TransitionBatch:
+        """Sample a batch uniformly, or proportionally to priority if prioritized."""
+        size = len(self)
+        if size == 0:
+            raise ValueError("Cannot sample from an empty replay buffer.")
+        rng = rng or np.random.default_rng()
+
+        if self.tree is None:
+            oldest = self.meta.position - size
+            indices = (oldest + rng.integers(0, size, size=batch_size)) % self.capacity
+            weights = np.ones(batch_size, dtype=np.float32)
+        else:
+            # Stratified sampling: one draw from each equal slice of the total priority.
+            total = self.tree.total
+            bounds = np.linspace(0.0, total, batch_size + 1)
+            values = rng.uniform(bounds[:-1], bounds[1:])
+            indices = np.minimum(self.tree.find(values), self.meta.size - 1)
+            # A zero-priority hit (only possible through rounding) must not
+            # turn into an infinite weight.
+            probabilities = np.maximum(self.tree.get(indices) / total, np.finfo(np.float64).tiny)
+            weights = (size * probabilities) ** -beta
+            weights = (weights / weights.max()).astype(np.float32)
+
+        done = self._arrays["done"][indices]
+        next_observation = self._arrays["observation"][(indices + 1) % self.capacity]
+        next_observation[done] = 0
+        return TransitionBatch(
+            **{name: self._arrays[name][indices] for name in REPLAY_FIELDS},
+            next_observation=next_observation,
+            indices=indices,
+            weights=weights,
+        )
+
+    def update_priorities(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """Set new priorities (e.g. absolute TD errors) for previously sampled transitions."""
+        if self.tree is None:
+            raise RuntimeError("Replay buffer was not created with prioritized=True.")
+        if len(indices) == 0:
+            return
+        priorities = np.abs(np.asarray(priorities, dtype=np.float64)) + PRIORITY_EPSILON
+        self.tree.update(indices, priorities**self.alpha)
+        self.meta.max_priority = max(self.meta.max_priority, float(priorities.max()))
+
+    def flush(self) -> None:
+        """Write buffered pages and the ring buffer position to disk."""
+        for array in self._arrays.values():
+            array.flush()
+        if self.tree is not None:
+            self.tree.tree.flush()
+        (self.directory / REPLAY_META_FILENAME).write_text(
+            self.meta.model_dump_json(indent=2), encoding="utf-8"
+        )
+
+    def close(self) -> None:
+        """Flush to disk; the buffer can be reopened from the same directory."""
+        if hasattr(self, "_arrays"):
+            self.flush()
+
+    def _open_memmap(self, filename: str, shape: tuple[int, ...], dtype: str) -> np.memmap:
+        path = self.directory / filename
+        if path.exists():
+            return np.lib.format.open_memmap(path, mode="r+")
+        return np.lib.format.open_memmap(path, mode="w+", shape=shape, dtype=dtype)
@@ -0,0 +1,64 @@
+import numpy as np
+
+
+class SumTree:
+    """Binary sum tree over `capacity` priorities stored in a flat array.
+
+    Node `i` has children `2i` and `2i + 1`; leaves start at `self.leaf_offset`
+    and the root (index 1) holds the total. All operations work on batches of
+    indices so a batch costs O(log n) vectorized steps.
+    """
+
+    def __init__(self, capacity: int, tree: np.ndarray | None = None):
+        self.capacity = capacity
+        self.leaf_offset = self.tree_size(capacity) // 2
+        if tree is None:
+            tree = np.zeros(2 * self.leaf_offset, dtype=np.float64)
+        if tree.shape != (2 * self.leaf_offset,):
+            raise ValueError(
+                f"Expected a tree of shape {(2 * self.leaf_offset,)}, got {tree.shape}."
+            )
+        self.tree = tree
+
+    @staticmethod
+    def tree_size(capacity: int) -> int:
+        """Length of the flat array backing a tree over `capacity` leaves."""
+        return 2 * (1 << max(capacity - 1, 0).bit_length())
+
+    @property
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        return self.tree[np.asarray(indices) + self.leaf_offset]
+
+    def update(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """Set the priorities of `indices` and propagate the new sums up to the root."""
+        nodes = np.asarray(indices, dtype=np.int64) + self.leaf_offset
+        if len(nodes) == 0:
+            return
+        self.tree[nodes] = priorities
+        nodes = np.unique(nodes // 2)
+        while nodes[0] >= 1:
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+            nodes = np.unique(nodes // 2)
+
+    def rebuild(self) -> None:
+        """Recompute every internal node from the leaves, one level at a time."""
+        size = self.leaf_offset
+        while size > 1:
+            parents = np.arange(size // 2, size)
+            self.tree[parents] = self.tree[2 * parents] + self.tree[2 * parents + 1]
+            size //= 2
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """Get the leaf index whose prefix-sum interval contains each of `values`."""
+        values = np.asarray(values, dtype=np.float64).copy()
+        nodes = np.ones(len(values), dtype=np.int64)
+        while nodes[0] < self.leaf_offset:
+            left = 2 * nodes
+            go_right = values >= self.tree[left]
+            values -= np.where(go_right, self.tree[left], 0.0)
+            nodes = left + go_right
+        # Floating point error can push a value past the last non-empty leaf.
+        return np.minimum(nodes - self.leaf_offset, self.capacity - 1)
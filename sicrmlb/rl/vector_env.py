@@ -0,0 +1,113 @@
+import numpy as np
+from typing import Any, Callable
+from PIL.Image import Image
+from concurrent.futures import ThreadPoolExecutor
+
+from sicrmlb.utils.device import Device
+from sicrmlb.rl._constants import NO_OP_ACTION
+
+
+def frame_to_observation(frame: Image) -> np.ndarray:
+    """Default observation: the capture-sized RGB frame as a uint8 array."""
+    return np.asarray(frame.convert("RGB"))
+
+
+class VectorEnv:
+    """Gym-style vector environment stepping several devices at once.
+
+    Taps and frame grabs are blocking adb/decoder calls, so they are dispatched
+    to a thread pool with one worker per device. Observations are written into
+    a single preallocated `(num_envs, *observation_shape)` array which, unless
+    `copy=True`, is returned as is and overwritten by the next `step()`.
+    """
+
+    def __init__(
+        self,
+        devices: list[Device],
+        observe: Callable[[Image], np.ndarray] = frame_to_observation,
+        reward_fn: Callable[[np.ndarray, np.ndarray], float] | None = None,
+        done_fn: Callable[[np.ndarray], bool] | None = None,
+        copy: bool = False,
+    ):
+        if not devices:
+            raise ValueError("VectorEnv needs at least one device.")
+        self.devices = devices
+        self.observe = observe
+        self.reward_fn = reward_fn
+        self.done_fn = done_fn
+        self.copy = copy
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._observations: np.ndarray | None = None
+
+    @property
+    def num_envs(self) -> int:
+        return len(self.devices)
+
+    def reset(self) -> tuple[np.ndarray, dict[str, Any]]:
+        """Start capturing on every device and return the first stacked observations."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_envs)
+        for device in self.devices:
+            if not device.is_capturing:
+                device.start_capture()
+        self._observations = None
+        return self._gather_observations(), {}
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """Tap `actions[i]` on device `i` and gather the next observations.
+
+        `actions` has shape `(num_envs, 2)` holding tap coordinates; a row equal
+        to `NO_OP_ACTION` leaves that device untouched for this step.
+        """
+        if self._executor is None or self._observations is None:
+            raise RuntimeError("Call reset() before step().")
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs, 2):
+            raise ValueError(
+                f"Expected actions of shape {(self.num_envs, 2)}, got {actions.shape}."
+            )
+
+        previous = self._observations.copy() if self.reward_fn is not None else None
+        list(self._executor.map(self._tap, self.devices, actions))
+        observations = self._gather_observations()
+
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        for i in range(self.num_envs):
+            if previous is not None and self.reward_fn is not None:
+                rewards[i] = self.reward_fn(previous[i], observations[i])
+            if self.done_fn is not None:
+                terminated[i] = self.done_fn(observations[i])
+        return observations, rewards, terminated, truncated, {}
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._observations = None
+        for device in self.devices:
+            device.stop_capture()
+
+    def _gather_observations(self) -> np.ndarray:
+        if self._executor is None:
+            raise RuntimeError("Call reset() before gathering observations.")
+        observations = list(
+            self._executor.map(lambda device: self.observe(device.get_frame()), self.devices)
+        )
+        if self._observations is None:
+            self._observations = np.empty(
+                (self.num_envs, *observations[0].shape), dtype=observations[0].dtype
+            )
+        for i, observation in enumerate(observations):
+            self._observations[i] = observation
+        return self._observations.copy() if self.copy else self._observations
+
+    @staticmethod
+    def _tap(device: Device, action: np.ndarray) -> None:
+        if (action == NO_OP_ACTION).all():
+            return
+        device.do_tap(int(action[0]), int(action[1]))
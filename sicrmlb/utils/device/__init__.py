@@ -3,6 +3,7 @@ from PIL.Image import Image
 import PIL.Image as PILImage
 
 from sicrmlb.utils.device import _constants
+from sicrmlb.utils.device._types import DecoderStats
 from sicrmlb.utils.device.adb import AndroidDebugBridge
 from sicrmlb.utils.device.decoder import Decoder
 
@@ -34,7 +35,14 @@ class Device:
             self.adb._process.terminate()
             self.adb._process = None
         if hasattr(self, "decoder"):
-            self.decoder.frame_thread.join(timeout=1)
+            if hasattr(self.decoder, "frame_thread"):
+                self.decoder.frame_thread.join(timeout=1)
+            del self.decoder
+
+    @property
+    def is_capturing(self) -> bool:
+        """Whether start_capture() was called without a matching stop_capture()."""
+        return hasattr(self, "decoder")
 
     def get_frame(self) -> Image:
         """Get the current frame from the Android device as a PIL Image."""
@@ -47,3 +55,9 @@ class Device:
             format="rgb24",
         ).to_image()
         return img
+
+    def get_decoder_stats(self) -> DecoderStats:
+        """Get decoding throughput and skipped frame counts for the capture."""
+        if not hasattr(self, "decoder"):
+            raise RuntimeError("Capture has not been started.")
+        return self.decoder.get_stats()
@@ -1,2 +1,4 @@
 CAPTURE_WIDTH = 368
-CAPTURE_HEIGHT = 652
\ No newline at end of file
+CAPTURE_HEIGHT = 652
+
+DECODE_FPS_WINDOW = 1.0  # Seconds of published frames averaged by Decoder.get_stats()
@@ -4,3 +4,11 @@ from pydantic import BaseModel
 class DeviceMetrics(BaseModel):
     height: int
     width: int
+
+
+class DecoderStats(BaseModel):
+    decode_fps: float
+    decoded_frames: int
+    unread_frames: int
+    skipped_frames: int
+    is_shedding: bool
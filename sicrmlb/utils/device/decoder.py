@@ -5,16 +5,45 @@ from typing import IO
 import av
 import logging
 import subprocess as sp
+from collections import deque
+
+from sicrmlb.utils.device._types import DecoderStats
+from sicrmlb.utils.device._constants import DECODE_FPS_WINDOW
+
+H264_START_CODE = b"\x00\x00\x01"
+H264_SLICE_NAL_TYPES = (1, 5)
 
 logger = logging.getLogger(__name__)
 
 
 class Decoder:
-    def __init__(self, adb_pipe: IO[bytes]):
+    def __init__(
+        self,
+        adb_pipe: IO[bytes],
+        adaptive: bool = True,
+        max_lag: int = 3,
+        recover_after: int = 10,
+    ):
         self.adb_pipe = adb_pipe
         self.codec = av.CodecContext.create("h264", "r")
 
+        # Load shedding: once `max_lag` decoded frames in a row are overwritten
+        # without being read, the codec stops decoding non-reference frames
+        # until the consumer keeps up for `recover_after` frames in a row.
+        self.adaptive = adaptive
+        self.max_lag = max_lag
+        self.recover_after = recover_after
+
         self._frame = None
+        self._frame_read = False
+        self._lag = 0
+        self._caught_up = 0
+        self._shedding = False
+
+        self._decoded_frames = 0
+        self._unread_frames = 0
+        self._skipped_frames = 0
+        self._publish_times: deque[float] = deque(maxlen=1024)
 
     def get_current_frame(self) -> av.VideoFrame | None:
         """Get the current video frame from the decoder."""
@@ -25,8 +54,19 @@ class Decoder:
             time.sleep(0.01)
             continue
 
+        self._frame_read = True
         return self._frame
 
+    def get_stats(self) -> DecoderStats:
+        """Get decoding throughput and load shedding counters."""
+        return DecoderStats(
+            decode_fps=self._decode_fps(),
+            decoded_frames=self._decoded_frames,
+            unread_frames=self._unread_frames,
+            skipped_frames=self._skipped_frames,
+            is_shedding=self._shedding,
+        )
+
     def _start_updating_frame(self):
         self.frame_thread = threading.Thread(target=self._update_current_frame)
         self.frame_thread.daemon = True
@@ -40,10 +80,45 @@ class Decoder:
             try:
                 frame = self._get_last_frame(line)
                 if frame is not None:
-                    self._frame = frame
+                    self._publish_frame(frame)
             except Exception as e:
                 logger.error(f"Error decoding frame: {e}")
 
+    def _publish_frame(self, frame: av.VideoFrame) -> None:
+        if self._frame is not None and not self._frame_read:
+            self._unread_frames += 1
+            self._lag += 1
+            self._caught_up = 0
+        else:
+            self._lag = 0
+            self._caught_up += 1
+
+        self._frame = frame
+        self._frame_read = False
+        self._decoded_frames += 1
+        self._publish_times.append(time.monotonic())
+
+        if not self.adaptive:
+            return
+        if not self._shedding and self._lag >= self.max_lag:
+            self._set_shedding(True)
+        elif self._shedding and self._caught_up >= self.recover_after:
+            self._set_shedding(False)
+
+    def _set_shedding(self, enabled: bool) -> None:
+        self.codec.skip_frame = "NONREF" if enabled else "DEFAULT"
+        self._shedding = enabled
+        logger.debug(
+            f"{'Enabled' if enabled else 'Disabled'} frame skipping "
+            f"(lag={self._lag}, decode fps={self._decode_fps():.1f})."
+        )
+
+    def _decode_fps(self) -> float:
+        # Measured against the current time, so a stalled stream reads as 0 fps.
+        since = time.monotonic() - DECODE_FPS_WINDOW
+        recent = sum(1 for t in tuple(self._publish_times) if t >= since)
+        return recent / DECODE_FPS_WINDOW
+
     def _get_last_frame(self, line: bytes) -> av.VideoFrame | None:
         if not line:
             return None
@@ -51,11 +126,28 @@ class Decoder:
         if os.name == "nt":
             line = line.replace(b"\r\n", b"\n")
 
-        packets = self.codec.parse(line)
-        if not packets:
-            return None
+        # Every packet must reach the codec, even if only the last frame is
+        # published; dropping one would break the frames that reference it.
+        frame = None
+        for packet in self.codec.parse(line):
+            if self._shedding and is_non_reference(bytes(packet)):
+                self._skipped_frames += 1
+            frames = self.codec.decode(packet)
+            if frames:
+                frame = frames[-1]
+        return frame
 
-        frames = self.codec.decode(packets[-1])
-        if not frames:
-            return None
-        return frames[-1]
+
+def is_non_reference(data: bytes) -> bool:
+    """Check whether an Annex B H.264 packet only holds non-reference slices.
+
+    Those are the packets a codec with `skip_frame = "NONREF"` drops.
+    """
+    has_slice = False
+    for nal in data.split(H264_START_CODE)[1:]:
+        if not nal or nal[0] & 0x1F not in H264_SLICE_NAL_TYPES:
+            continue
+        has_slice = True
+        if (nal[0] >> 5) & 0x3:  # nal_ref_idc
+            return False
+    return has_slice
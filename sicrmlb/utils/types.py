@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class FieldSpec(BaseModel):
+    """dtype and per-sample shape of an array field stored on disk."""
+
+    dtype: str
+    shape: list[int]
@@ -0,0 +1,78 @@
+import av
+import numpy as np
+import pytest
+from PIL.Image import Image
+from PIL import Image as PILImage
+from pathlib import Path
+
+from sicrmlb.dataset import ShardedDataset
+from sicrmlb.gamestate.elixir.detector import ElixirDetector
+from tools.extract_dataset import extract_sample, extract_video
+
+
+@pytest.fixture
+def sample_frame() -> Image:
+    """Fixture to load the test screenshot 'testing_frame.png' from the detector tests."""
+    img_path = Path(__file__).parent.parent / "detectors" / "testing_frame.png"
+    return PILImage.open(img_path).convert("RGB")
+
+
+def write_raw_recording(path: Path, frame: Image, keyframe_interval: int) -> Path:
+    """Encode 20 copies of `frame` as a raw H.264 stream."""
+    container = av.open(str(path), "w", format="h264")
+    stream = container.add_stream("libx264", rate=30)
+    stream.width, stream.height, stream.pix_fmt = frame.width, frame.height, "yuv420p"
+    stream.options = {
+        "g": str(keyframe_interval),
+        "keyint_min": str(keyframe_interval),
+        "sc_threshold": "0",
+        "bf": "0",
+    }
+    for _ in range(20):
+        for packet in stream.encode(av.VideoFrame.from_image(frame)):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    return path
+
+
+@pytest.fixture
+def raw_recording(tmp_path: Path, sample_frame: Image) -> Path:
+    """A raw H.264 stream of 20 frames with a single keyframe."""
+    return write_raw_recording(tmp_path / "match.h264", sample_frame, keyframe_interval=1000)
+
+
+@pytest.mark.dataset
+def test_extract_sample_crops_and_labels_frame(sample_frame: Image):
+    sample = extract_sample(sample_frame, ElixirDetector(), frame_index=7, timestamp=1.5)
+
+    assert sample["cards"].shape == (4, 104, 72, 3)
+    assert sample["elixir"].shape == (20, 260, 3)
+    assert sample["arena"].shape == (189, 288, 3)
+    assert sample["elixir_amount"] == 10
+    assert sample["frame_index"] == 7 and sample["timestamp"] == 1.5
+
+
+@pytest.mark.dataset
+def test_extract_video_caps_shards_and_times_raw_streams(tmp_path: Path, raw_recording: Path):
+    output = tmp_path / "dataset"
+    assert extract_video(raw_recording, output, shard_size=4, stride=1, fps=10.0) == 20
+
+    dataset = ShardedDataset(output)
+    # No keyframe after the first one, so shards are cut once the buffer is full.
+    assert [shard.length for shard in dataset.index.shards] == [4] * 5
+    assert [shard.starts_on_keyframe for shard in dataset.index.shards] == [True] + [False] * 4
+    timestamps = np.array([dataset[i]["timestamp"] for i in range(len(dataset))])
+    assert timestamps == pytest.approx(np.arange(20) / 10.0)
+
+
+@pytest.mark.dataset
+def test_extract_video_ends_shards_on_keyframes(tmp_path: Path, sample_frame: Image):
+    recording = write_raw_recording(tmp_path / "match.h264", sample_frame, keyframe_interval=3)
+    output = tmp_path / "dataset"
+    assert extract_video(recording, output, shard_size=4, stride=1, fps=10.0) == 20
+
+    dataset = ShardedDataset(output)
+    assert [shard.length for shard in dataset.index.shards] == [3] * 6 + [2]
+    assert all(shard.starts_on_keyframe for shard in dataset.index.shards)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from pathlib import Path
+
+from sicrmlb.dataset import ShardedDataset, ShardWriter, merge_indices
+
+
+def _write_shards(directory: Path, lengths: list[int], start: int = 0) -> None:
+    writer = ShardWriter(directory, source=directory.name)
+    value = start
+    for length in lengths:
+        for _ in range(length):
+            writer.append(
+                {
+                    "frame_index": np.int64(value),
+                    "crop": np.full((2, 3, 3), value % 256, dtype=np.uint8),
+                }
+            )
+            value += 1
+        writer.flush()
+    writer.close()
+
+
+@pytest.mark.dataset
+def test_sharded_dataset_round_trip(tmp_path: Path):
+    _write_shards(tmp_path / "a", [3, 2])
+    _write_shards(tmp_path / "b", [4], start=5)
+    index = merge_indices(tmp_path, [tmp_path / "a", tmp_path / "b"])
+
+    dataset = ShardedDataset(tmp_path)
+
+    assert index.length == len(dataset) == 9
+    assert [shard.source for shard in index.shards] == ["a", "a", "b"]
+    for i in range(len(dataset)):
+        sample = dataset[i]
+        assert sample["frame_index"] == i
+        assert sample["crop"].shape == (2, 3, 3)
+        assert (sample["crop"] == i).all()
+    assert isinstance(dataset.get_shard(0, "crop"), np.memmap)
+
+
+@pytest.mark.dataset
+def test_sharded_dataset_iter_batches_covers_every_sample(tmp_path: Path):
+    _write_shards(tmp_path, [5, 3])
+    dataset = ShardedDataset(tmp_path)
+
+    seen = []
+    for batch in dataset.iter_batches(2, fields=["frame_index"], shuffle=True, seed=0):
+        assert set(batch) == {"frame_index"}
+        assert len(batch["frame_index"]) <= 2
+        seen += batch["frame_index"].tolist()
+
+    assert sorted(seen) == list(range(8))
+
+
+@pytest.mark.dataset
+def test_shard_writer_rejects_mismatched_fields(tmp_path: Path):
+    writer = ShardWriter(tmp_path)
+    writer.append({"frame_index": np.int64(0)})
+
+    with pytest.raises(ValueError):
+        writer.append({"timestamp": np.float64(0.0)})
+
+
+@pytest.mark.dataset
+def test_shard_writer_caps_buffered_bytes(tmp_path: Path):
+    writer = ShardWriter(tmp_path, max_shard_size=16, max_shard_bytes=3 * 1024)
+    for i in range(7):
+        writer.append({"image": np.full((32, 32), i, dtype=np.uint8)})
+    index = writer.close()
+
+    assert writer.capacity == 3
+    assert [shard.length for shard in index.shards] == [3, 3, 1]
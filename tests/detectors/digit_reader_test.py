@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from PIL.Image import Image
+from PIL import Image as PILImage
+from pathlib import Path
+
+from sicrmlb.gamestate._ocr import DigitReader, DigitTemplateBank, load_template_bank
+from sicrmlb.gamestate.timer.detector import TimerDetector
+from sicrmlb.gamestate.towers._constants import TOWER_DIGIT_TEMPLATES
+
+
+@pytest.fixture
+def sample_frame() -> Image:
+    """Fixture to load a test screenshot image named 'testing_frame.png' located next to this test file."""
+    img_path = Path(__file__).with_name("testing_frame.png")
+    return PILImage.open(img_path).convert("RGB")
+
+
+@pytest.fixture
+def enemy_hp_glyphs(sample_frame: Image) -> dict[str, np.ndarray]:
+    """Column slices of the enemy left tower's "2703", plus the background either side."""
+    roi = np.asarray(sample_frame)[83:92, 69:101]
+    return {
+        "left": roi[:, :3],
+        "2": roi[:, 3:10],
+        "7": roi[:, 10:15],
+        "0": roi[:, 15:23],
+        "3": roi[:, 23:30],
+        "right": roi[:, 30:],
+    }
+
+
+@pytest.mark.ocr
+@pytest.mark.parametrize("text", ["0327", "723", "3200", "77"])
+def test_digit_reader_reads_rearranged_glyphs(enemy_hp_glyphs: dict[str, np.ndarray], text: str):
+    roi = np.concatenate(
+        [enemy_hp_glyphs["left"]] + [enemy_hp_glyphs[c] for c in text] + [enemy_hp_glyphs["right"]],
+        axis=1,
+    )
+    reader = DigitReader(load_template_bank(TOWER_DIGIT_TEMPLATES))
+
+    assert reader.read(roi) == text
+
+
+@pytest.mark.ocr
+def test_timer_detector_reads_rearranged_time(sample_frame: Image):
+    # Rebuild "2:47" as "4:27" from the frame's own glyphs.
+    frame = sample_frame.copy()
+    frame.paste(sample_frame.crop((333, 17, 346, 33)), (315, 17))  # 4
+    frame.paste(sample_frame.crop((316, 17, 328, 33)), (333, 17))  # 2
+    frame.paste(sample_frame.crop((346, 17, 358, 33)), (345, 17))  # 7
+
+    assert TimerDetector().perform_analysis(frame).seconds_left == 4 * 60 + 27
+
+
+@pytest.mark.ocr
+def test_digit_reader_reads_glyphs_left_out_of_the_bank(sample_frame: Image):
+    # All from the same capture, but none of the ROIs read below went into the bank.
+    rgb = np.asarray(sample_frame)
+    samples = [
+        (rgb[83:92, 69:101], "2703"),  # enemy left tower
+        (rgb[405:414, 69:101], "3052"),  # friendly left tower
+        (rgb[623:638, 100:121], "10"),  # elixir counter
+        (rgb[606:619, 110:121], "2"),  # card costs
+        (rgb[606:619, 177:190], "4"),
+        (rgb[606:619, 317:330], "5"),
+    ]
+    reader = DigitReader(DigitTemplateBank.from_samples(samples))
+
+    assert reader.read(rgb[83:92, 269:301]) == "2703"  # enemy right tower
+    assert reader.read(rgb[405:414, 269:301]) == "3052"  # friendly right tower
+    assert reader.read(rgb[17:33, 315:328]) == "2"  # timer minutes
+    assert reader.read(rgb[606:619, 247:260]) == "4"  # third card cost
+
+
+@pytest.mark.ocr
+def test_digit_reader_tells_missing_text_from_unreadable_text(sample_frame: Image):
+    rgb = np.asarray(sample_frame)
+    reader = DigitReader(DigitTemplateBank.from_samples([(rgb[83:92, 69:101], "2703")]))
+
+    assert reader.read(rgb[200:209, 150:182]) == ""  # arena grass
+    assert reader.read(np.zeros((9, 32, 3), dtype=np.uint8)) == ""
+    assert reader.read(rgb[405:414, 69:101]) is None  # "3052", 5 is not learned
+
+
+@pytest.mark.ocr
+def test_digit_reader_rejects_digits_without_real_templates(sample_frame: Image):
+    rgb = np.asarray(sample_frame)
+    bank = DigitTemplateBank.from_samples([(rgb[83:92, 69:101], "2703")])
+    reader = DigitReader(bank)
+
+    assert not bank.learned[5]
+    assert reader.read(rgb[405:414, 69:101]) is None  # "3052"
+    assert reader.read(rgb[83:92, 269:301]) == "2703"
+
+
+@pytest.mark.ocr
+def test_digit_reader_cache_survives_compression_jitter(sample_frame: Image):
+    roi = np.asarray(sample_frame)[83:92, 69:101]
+    reader = DigitReader(load_template_bank(TOWER_DIGIT_TEMPLATES))
+    assert reader.read(roi) == "2703"
+
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        jitter = rng.integers(-1, 2, size=roi.shape)
+        jittered = np.clip(roi.astype(np.int16) + jitter, 0, 255).astype(np.uint8)
+        assert reader.read(jittered) == "2703"
+
+    assert reader.misses == 1
+    assert reader.hits == 10
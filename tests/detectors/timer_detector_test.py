@@ -0,0 +1,40 @@
+import pytest
+from PIL.Image import Image
+from PIL import Image as PILImage
+from pathlib import Path
+
+from sicrmlb.gamestate.timer._types import TimerState
+from sicrmlb.gamestate.timer.detector import TimerDetector
+
+
+@pytest.fixture
+def sample_frame() -> Image:
+    """Fixture to load a test screenshot image named 'testing_frame.png' located next to this test file."""
+    img_path = Path(__file__).with_name("testing_frame.png")
+    return PILImage.open(img_path)
+
+
+@pytest.mark.timer
+def test_timer_detector_reads_time_left(sample_frame: Image):
+    detector = TimerDetector()
+    timer_state = detector.perform_analysis(sample_frame)
+
+    assert isinstance(timer_state, TimerState)
+    assert timer_state.seconds_left == 2 * 60 + 47
+
+
+@pytest.mark.timer
+def test_timer_detector_reuses_cached_reads(sample_frame: Image):
+    detector = TimerDetector()
+    first = detector.perform_analysis(sample_frame)
+    second = detector.perform_analysis(sample_frame)
+
+    assert first.seconds_left == second.seconds_left
+    assert detector.reader.misses == 2  # minutes and seconds, read once each
+    assert detector.reader.hits == 2
+
+
+@pytest.mark.timer
+def test_timer_detector_rejects_cropped_frame(sample_frame: Image):
+    with pytest.raises(ValueError):
+        TimerDetector().perform_analysis(sample_frame.crop((0, 0, 100, 100)))
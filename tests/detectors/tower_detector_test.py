@@ -0,0 +1,45 @@
+import pytest
+from PIL.Image import Image
+from PIL import Image as PILImage
+from pathlib import Path
+
+from sicrmlb.gamestate.towers._types import TowerPosition, TowersState
+from sicrmlb.gamestate.towers.detector import TowerDetector
+
+
+@pytest.fixture
+def sample_frame() -> Image:
+    """Fixture to load a test screenshot image named 'testing_frame.png' located next to this test file."""
+    img_path = Path(__file__).with_name("testing_frame.png")
+    return PILImage.open(img_path)
+
+
+@pytest.mark.towers
+def test_tower_detector_reads_princess_tower_hit_points(sample_frame: Image):
+    detector = TowerDetector()
+    towers_state = detector.perform_analysis(sample_frame)
+
+    assert isinstance(towers_state, TowersState)
+    assert towers_state.hit_points == {
+        TowerPosition.ENEMY_LEFT: 2703,
+        TowerPosition.ENEMY_RIGHT: 2703,
+        TowerPosition.FRIENDLY_LEFT: 3052,
+        TowerPosition.FRIENDLY_RIGHT: 3052,
+    }
+
+
+@pytest.mark.towers
+def test_tower_detector_only_rereads_changed_rois(sample_frame: Image):
+    detector = TowerDetector()
+    detector.perform_analysis(sample_frame)
+    misses = detector.reader.misses
+
+    # Cover the enemy left tower's hit points with grass, as once it is
+    # destroyed; only that ROI changes.
+    frame = sample_frame.convert("RGB")
+    frame.paste(frame.crop((150, 200, 182, 209)), (69, 83))
+    towers_state = detector.perform_analysis(frame)
+
+    assert towers_state.hit_points[TowerPosition.ENEMY_LEFT] == 0
+    assert towers_state.hit_points[TowerPosition.FRIENDLY_RIGHT] == 3052
+    assert detector.reader.misses == misses + 1
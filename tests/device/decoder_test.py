@@ -0,0 +1,109 @@
+import io
+import time
+import av
+import numpy as np
+import pytest
+
+from sicrmlb.utils.device.decoder import Decoder, is_non_reference
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Freeze time.monotonic at a value the test can advance."""
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def _encode_h264(num_frames: int) -> bytes:
+    """Encode an Annex B stream with non-reference B-frames between references."""
+    output = io.BytesIO()
+    container = av.open(output, "w", format="h264")
+    stream = container.add_stream("libx264", rate=30)
+    stream.width, stream.height, stream.pix_fmt = 64, 64, "yuv420p"
+    stream.options = {"bf": "2", "b-pyramid": "none", "g": "1000"}
+    for i in range(num_frames):
+        image = np.full((64, 64, 3), i * 8, dtype=np.uint8)
+        for packet in stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    return output.getvalue()
+
+
+def _publish(decoder: Decoder, count: int, read: bool) -> None:
+    for _ in range(count):
+        decoder._publish_frame(object())  # type: ignore[arg-type]
+        if read:
+            decoder.get_current_frame()
+
+
+@pytest.mark.decoder
+def test_decoder_sheds_load_while_consumer_lags(clock: list[float]):
+    decoder = Decoder(io.BytesIO(), max_lag=3, recover_after=4)
+    _publish(decoder, 1, read=True)
+
+    # The first frame after a read replaces a frame that was read, so it does
+    # not count as lag.
+    _publish(decoder, 3, read=False)
+    assert not decoder.get_stats().is_shedding
+    assert decoder.codec.skip_frame == "DEFAULT"
+
+    _publish(decoder, 1, read=False)
+    stats = decoder.get_stats()
+    assert stats.is_shedding
+    assert decoder.codec.skip_frame == "NONREF"
+    assert stats.unread_frames == 3
+
+    decoder.get_current_frame()
+    _publish(decoder, 3, read=True)
+    assert decoder.get_stats().is_shedding
+    _publish(decoder, 1, read=True)
+
+    stats = decoder.get_stats()
+    assert not stats.is_shedding
+    assert decoder.codec.skip_frame == "DEFAULT"
+    assert stats.decoded_frames == 9
+    assert stats.unread_frames == 3
+    assert stats.decode_fps == pytest.approx(9.0)
+
+    # A stalled stream decays to 0 fps instead of keeping its last rate.
+    clock[0] += 2.0
+    assert decoder.get_stats().decode_fps == 0.0
+
+
+@pytest.mark.decoder
+def test_decoder_never_sheds_when_not_adaptive():
+    decoder = Decoder(io.BytesIO(), adaptive=False, max_lag=1)
+    _publish(decoder, 5, read=False)
+
+    stats = decoder.get_stats()
+    assert not stats.is_shedding
+    assert decoder.codec.skip_frame == "DEFAULT"
+    assert stats.unread_frames == 4
+
+
+@pytest.mark.decoder
+def test_is_non_reference_reads_nal_ref_idc():
+    sps = b"\x00\x00\x00\x01\x67\x64\x00\x1e"
+    assert is_non_reference(b"\x00\x00\x00\x01\x01\x9e\x61")  # non-reference P/B slice
+    assert not is_non_reference(b"\x00\x00\x00\x01\x41\x9a\x24")  # reference slice
+    assert not is_non_reference(sps + b"\x00\x00\x01\x65\x88")  # IDR slice
+    assert not is_non_reference(sps)  # no slice at all
+
+
+@pytest.mark.decoder
+def test_decoder_decodes_and_counts_every_parsed_packet():
+    data = _encode_h264(12)
+    decoder = Decoder(io.BytesIO())
+    decoder._set_shedding(True)
+
+    # Pass the whole stream at once so parse() returns many packets.
+    frame = decoder._get_last_frame(data)
+    packets = av.CodecContext.create("h264", "r").parse(data)
+    non_reference = sum(is_non_reference(bytes(packet)) for packet in packets)
+
+    assert frame is not None
+    assert non_reference > 1
+    assert decoder.get_stats().skipped_frames == non_reference
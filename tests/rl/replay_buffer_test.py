@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from pathlib import Path
+
+from sicrmlb.rl import ReplayBuffer, SumTree
+
+
+def _fill(buffer: ReplayBuffer, count: int) -> None:
+    for i in range(count):
+        observation = np.full(3, i, dtype=np.float32)
+        buffer.append(observation, (i, i + 1), float(i), observation + 1, i % 2 == 0)
+
+
+@pytest.mark.replay
+def test_replay_buffer_wraps_and_samples(tmp_path: Path):
+    buffer = ReplayBuffer(tmp_path, capacity=4, observation_shape=(3,))
+    _fill(buffer, 6)
+
+    # Transitions 0 and 1 were overwritten by 4 and 5, and 2 by the
+    # next_observation of 5.
+    assert len(buffer) == 3
+    batch = buffer.sample(32, rng=np.random.default_rng(0))
+    assert set(batch.reward.tolist()) == {3.0, 4.0, 5.0}
+    assert (batch.observation[:, 0] == batch.reward).all()
+    done = batch.done[:, None]
+    assert (batch.next_observation == np.where(done, 0.0, batch.observation + 1)).all()
+    assert (batch.action[:, 1] == batch.action[:, 0] + 1).all()
+    assert (batch.weights == 1.0).all()
+
+
+@pytest.mark.replay
+def test_replay_buffer_stores_each_observation_once(tmp_path: Path):
+    buffer = ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,))
+    observations = [np.full(3, i, dtype=np.float32) for i in range(4)]
+    for i in range(3):
+        buffer.append(observations[i], (0, 0), 0.0, observations[i + 1], False)
+
+    assert sorted(path.name for path in tmp_path.glob("*.npy")) == [
+        "action.npy",
+        "done.npy",
+        "observation.npy",
+        "reward.npy",
+    ]
+    batch = buffer.sample(16, rng=np.random.default_rng(0))
+    assert (batch.next_observation == batch.observation + 1).all()
+    assert (batch.indices < 3).all()
+
+
+@pytest.mark.replay
+def test_replay_buffer_resumes_after_reopen(tmp_path: Path):
+    buffer = ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,), prioritized=True)
+    _fill(buffer, 5)
+    buffer.flush()
+    del buffer
+
+    reopened = ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,), prioritized=True)
+    assert len(reopened) == 5
+    assert reopened.append(np.zeros(3), (0, 0), 0.0, np.zeros(3), False) == 5
+    assert reopened.tree is not None and reopened.tree.total == pytest.approx(6.0)
+
+    with pytest.raises(ValueError):
+        ReplayBuffer(tmp_path, capacity=16, observation_shape=(3,), prioritized=True)
+
+
+@pytest.mark.replay
+def test_prioritized_sampling_follows_priorities(tmp_path: Path):
+    buffer = ReplayBuffer(tmp_path, capacity=4, observation_shape=(3,), prioritized=True, alpha=1.0)
+    _fill(buffer, 4)
+    buffer.update_priorities(np.arange(4), np.array([0.0, 0.0, 0.0, 10.0]))
+
+    batch = buffer.sample(16, rng=np.random.default_rng(0))
+    assert (batch.indices == 3).all()
+
+    assert buffer.tree is not None
+    total = buffer.tree.total
+    buffer.update_priorities(np.array([], dtype=np.int64), np.array([]))
+    assert buffer.tree.total == total
+
+
+@pytest.mark.replay
+def test_sum_tree_find_matches_prefix_sums():
+    priorities = np.array([1.0, 0.0, 3.0, 2.0, 4.0])
+    tree = SumTree(len(priorities))
+    tree.update(np.arange(len(priorities)), priorities)
+
+    values = np.linspace(0.0, priorities.sum(), 50, endpoint=False)
+    expected = np.searchsorted(np.cumsum(priorities), values, side="right")
+    assert tree.total == pytest.approx(priorities.sum())
+    assert (tree.find(values) == expected).all()
+
+
+@pytest.mark.replay
+def test_reopen_drops_priorities_of_unflushed_rows(tmp_path: Path):
+    buffer = ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,), prioritized=True)
+    _fill(buffer, 5)
+    buffer.flush()
+    # Simulate a crash: these rows reach the memory-mapped tree but not the meta file.
+    _fill(buffer, 2)
+    assert buffer.tree is not None
+    buffer.tree.tree.flush()
+
+    reopened = ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,), prioritized=True)
+    assert len(reopened) == 5
+    assert reopened.tree is not None and reopened.tree.total == pytest.approx(5.0)
+
+    batch = reopened.sample(500, rng=np.random.default_rng(0))
+    assert np.bincount(batch.indices, minlength=5).tolist() == [100] * 5
+    assert np.isfinite(batch.weights).all()
+
+
+@pytest.mark.replay
+def test_replay_buffer_close_flushes(tmp_path: Path):
+    buffer = ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,))
+    _fill(buffer, 3)
+    buffer.close()
+
+    assert len(ReplayBuffer(tmp_path, capacity=8, observation_shape=(3,))) == 3
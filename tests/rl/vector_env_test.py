@@ -0,0 +1,175 @@
+import threading
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image as PILImage
+
+from sicrmlb.rl import InferenceServer, VectorEnv
+from sicrmlb.rl._constants import NO_OP_ACTION
+
+
+class FakeDevice:
+    def __init__(self, shade: int):
+        self.shade = shade
+        self.taps: list[tuple[int, int]] = []
+        self.started = False
+        self.starts = 0
+
+    @property
+    def is_capturing(self) -> bool:
+        return self.started
+
+    def start_capture(self) -> None:
+        self.started = True
+        self.starts += 1
+
+    def stop_capture(self) -> None:
+        self.started = False
+
+    def do_tap(self, x: int, y: int) -> None:
+        self.taps.append((x, y))
+
+    def get_frame(self) -> PILImage.Image:
+        return PILImage.new("RGB", (4, 3), (self.shade, len(self.taps), 0))
+
+
+@pytest.mark.vector_env
+def test_vector_env_steps_every_device():
+    devices = [FakeDevice(10), FakeDevice(20), FakeDevice(30)]
+    env = VectorEnv(devices, done_fn=lambda obs: bool(obs[0, 0, 1] >= 2))  # type: ignore
+
+    observations, _ = env.reset()
+    assert all(device.started for device in devices)
+    assert observations.shape == (3, 3, 4, 3)
+    assert observations[:, 0, 0, 0].tolist() == [10, 20, 30]
+
+    actions = np.array([[1, 2], NO_OP_ACTION, [5, 6]])
+    observations, rewards, terminated, truncated, _ = env.step(actions)
+    observations, rewards, terminated, truncated, _ = env.step(actions)
+
+    assert devices[0].taps == [(1, 2), (1, 2)]
+    assert devices[1].taps == []
+    assert observations[:, 0, 0, 1].tolist() == [2, 0, 2]
+    assert terminated.tolist() == [True, False, True]
+    assert not truncated.any() and not rewards.any()
+
+    with pytest.raises(ValueError):
+        env.step(np.zeros((2, 2)))
+    env.close()
+
+
+@pytest.mark.vector_env
+def test_vector_env_reuses_observation_buffer_and_restarts_after_close():
+    devices = [FakeDevice(10), FakeDevice(20)]
+    env = VectorEnv(devices)
+
+    first, _ = env.reset()
+    second, *_ = env.step(np.array([NO_OP_ACTION, NO_OP_ACTION]))
+    assert second is first
+
+    env.close()
+    assert not any(device.started for device in devices)
+    with pytest.raises(RuntimeError):
+        env.step(np.array([NO_OP_ACTION, NO_OP_ACTION]))
+
+    observations, _ = env.reset()
+    assert [device.starts for device in devices] == [2, 2]
+    assert observations[:, 0, 0, 0].tolist() == [10, 20]
+    env.close()
+
+
+@pytest.mark.vector_env
+def test_inference_server_batches_submitted_observations():
+    batch_sizes = []
+
+    def policy(observations: np.ndarray) -> np.ndarray:
+        batch_sizes.append(len(observations))
+        return observations.sum(axis=1)
+
+    server = InferenceServer(policy, max_batch_size=4, max_wait=0.5)
+    futures = [server.submit(np.full(2, i)) for i in range(4)]
+    actions = [future.result(timeout=2) for future in futures]
+    server.stop()
+
+    assert actions == [0, 2, 4, 6]
+    assert sum(batch_sizes) == 4 and len(batch_sizes) <= 2
+    assert server.infer(np.ones((3, 2))).tolist() == [2, 2, 2]
+
+
+@pytest.mark.vector_env
+def test_inference_server_starts_one_worker_for_concurrent_submits():
+    server = InferenceServer(lambda observations: observations, max_batch_size=8)
+    barrier = threading.Barrier(8)
+
+    def submit(i: int):
+        barrier.wait()
+        return server.submit(np.array([i]))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = list(executor.map(submit, range(8)))
+    workers = [t for t in threading.enumerate() if t.name == "InferenceServer"]
+    results = [int(future.result(timeout=2)[0]) for future in futures]
+    server.stop()
+
+    assert len(workers) == 1
+    assert results == list(range(8))
+    assert not any(t.name == "InferenceServer" for t in threading.enumerate())
+
+
+@pytest.mark.vector_env
+def test_inference_server_stop_fails_pending_requests():
+    entered, release = threading.Event(), threading.Event()
+
+    def policy(observations: np.ndarray) -> np.ndarray:
+        entered.set()
+        release.wait(timeout=2)
+        return observations
+
+    server = InferenceServer(policy, max_batch_size=1, max_wait=0.0)
+    running = server.submit(np.zeros(1))
+    assert entered.wait(timeout=2)
+    pending = [server.submit(np.ones(1)) for _ in range(2)]
+
+    stopper = threading.Thread(target=server.stop)
+    stopper.start()
+    for future in pending:
+        assert isinstance(future.exception(timeout=2), RuntimeError)
+    release.set()
+    stopper.join(timeout=2)
+
+    assert not stopper.is_alive()
+    assert running.result(timeout=2).tolist() == [0.0]
+
+
+@pytest.mark.vector_env
+def test_inference_server_skips_cancelled_requests():
+    entered, release = threading.Event(), threading.Event()
+
+    def policy(observations: np.ndarray) -> np.ndarray:
+        entered.set()
+        release.wait(timeout=2)
+        return observations
+
+    server = InferenceServer(policy, max_batch_size=1, max_wait=0.0)
+    running = server.submit(np.zeros(1))
+    assert entered.wait(timeout=2)
+    cancelled = server.submit(np.ones(1))
+    assert cancelled.cancel()
+    assert not running.cancel()  # Already picked up by the worker
+
+    release.set()
+    assert running.result(timeout=2)[0] == 0
+    assert server.submit(np.full(1, 2)).result(timeout=2)[0] == 2
+
+    release.clear()
+    entered.clear()
+    server.submit(np.zeros(1))
+    assert entered.wait(timeout=2)
+    server.submit(np.ones(1)).cancel()
+
+    # stop() drains the cancelled request while the worker is still busy.
+    stopper = threading.Thread(target=server.stop)
+    stopper.start()
+    release.set()
+    stopper.join(timeout=2)
+    assert not stopper.is_alive()
@@ -0,0 +1,91 @@
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image as PILImage
+
+from sicrmlb.gamestate._ocr import DigitTemplateBank
+from sicrmlb.gamestate.timer._constants import (
+    TIMER_DIGIT_TEMPLATES,
+    TIMER_MINUTES_BOX,
+    TIMER_SECONDS_BOX,
+)
+from sicrmlb.gamestate.towers._constants import TOWER_DIGIT_TEMPLATES, TOWER_HP_HEIGHT, TOWER_HP_WIDTH
+from sicrmlb.gamestate.towers._types import TowerPosition
+from sicrmlb.gamestate.towers.detector import TOWER_HP_ORIGINS
+
+# --- Configuration ---
+BANKS = {
+    "timer": (
+        TIMER_DIGIT_TEMPLATES,
+        {"minutes": TIMER_MINUTES_BOX, "seconds": TIMER_SECONDS_BOX},
+    ),
+    "towers": (
+        TOWER_DIGIT_TEMPLATES,
+        {
+            position.value: (x, y, x + TOWER_HP_WIDTH, y + TOWER_HP_HEIGHT)
+            for position, (x, y) in TOWER_HP_ORIGINS.items()
+        },
+    ),
+}
+
+
+def parse_region(
+    region: str, regions: dict[str, tuple[int, int, int, int]]
+) -> tuple[int, int, int, int]:
+    if region in regions:
+        return regions[region]
+    box = region.split(",")
+    if len(box) != 4 or not all(value.isdigit() for value in box):
+        raise ValueError(
+            f"Unknown region {region!r}, expected one of {sorted(regions)} or x0,y0,x1,y1."
+        )
+    x0, y0, x1, y1 = (int(value) for value in box)
+    return x0, y0, x1, y1
+
+
+def parse_samples(
+    items: list[str], regions: dict[str, tuple[int, int, int, int]]
+) -> list[tuple[np.ndarray, str]]:
+    """Turn `frame.png region=digits ...` arguments into labelled ROIs.
+
+    A region is either one of `regions` or an explicit `x0,y0,x1,y1` box, so
+    other text in the same font (elixir counter, card costs) can be labelled.
+    """
+    samples = []
+    frame = None
+    for item in items:
+        if "=" not in item:
+            frame = np.asarray(PILImage.open(item).convert("RGB"))
+            continue
+        if frame is None:
+            raise ValueError(f"Label {item!r} given before any frame.")
+        region, text = item.split("=", 1)
+        if not text.isdigit():
+            raise ValueError(f"Label {text!r} for {region} must only contain digits.")
+        x0, y0, x1, y1 = parse_region(region, regions)
+        samples.append((frame[y0:y1, x0:x1], text))
+    return samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build a digit template bank from labelled capture frames, e.g. "
+        f"`towers frame.png {TowerPosition.ENEMY_LEFT.value}=2703`."
+    )
+    parser.add_argument("bank", choices=sorted(BANKS))
+    parser.add_argument("samples", nargs="+", help="Frames, each followed by region=digits labels")
+    parser.add_argument("--extend", action="store_true", help="Keep digits of the existing bank that have no samples")
+    args = parser.parse_args(sys.argv[1:])
+
+    output, regions = BANKS[args.bank]
+    samples = parse_samples(args.samples, regions)
+    base = DigitTemplateBank.load(output) if args.extend and output.exists() else None
+    bank = DigitTemplateBank.from_samples(samples, base)
+    bank.save(output)
+
+    learned = "".join(str(digit) for digit in np.nonzero(bank.learned)[0])
+    print(f"Saved {args.bank} templates to {output} (learned digits: {learned})")
+    if not bank.learned.all():
+        print("[!] Reads containing the other digits are rejected until they are labelled.")
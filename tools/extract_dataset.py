@@ -0,0 +1,217 @@
+import argparse
+import concurrent.futures
+import sys
+from pathlib import Path
+
+import av
+import numpy as np
+from PIL.Image import Image
+
+from sicrmlb.dataset import ShardWriter, merge_indices
+from sicrmlb.dataset._constants import DEFAULT_MAX_SHARD_BYTES, DEFAULT_SHARD_SIZE
+from sicrmlb.gamestate.elixir.detector import ElixirDetector
+from sicrmlb.utils.device._constants import CAPTURE_HEIGHT, CAPTURE_WIDTH
+from sicrmlb.gamestate.arena._constants import (
+    NUM_TILES_X,
+    NUM_TILES_Y,
+    TILE_HEIGHT,
+    TILE_START_X,
+    TILE_START_Y,
+    TILE_WIDTH,
+)
+from sicrmlb.gamestate.deck._constants import (
+    CARD_WIDTH,
+    CROPPED_DECK_HEIGHT,
+    CROPPED_DECK_WIDTH,
+    DECK_START_X,
+    DECK_START_Y,
+    NUM_CARDS_ON_HAND,
+)
+from sicrmlb.gamestate.elixir._constants import (
+    CROPPED_ELIXIR_HEIGHT,
+    CROPPED_ELIXIR_WIDTH,
+    ELIXIR_START_X,
+    ELIXIR_START_Y,
+)
+
+# --- Configuration ---
+RAW_H264_SUFFIXES = {".h264", ".264"}
+VIDEO_SUFFIXES = RAW_H264_SUFFIXES | {".mp4", ".mkv"}
+MAX_WORKERS = None  # Defaults to the number of CPUs
+
+ARENA_BOX = (
+    TILE_START_X,
+    TILE_START_Y,
+    TILE_START_X + int(TILE_WIDTH * NUM_TILES_X),
+    TILE_START_Y + round(TILE_HEIGHT * NUM_TILES_Y),
+)
+DECK_BOX = (
+    DECK_START_X,
+    DECK_START_Y,
+    DECK_START_X + CROPPED_DECK_WIDTH,
+    DECK_START_Y + CROPPED_DECK_HEIGHT,
+)
+ELIXIR_BOX = (
+    ELIXIR_START_X,
+    ELIXIR_START_Y,
+    ELIXIR_START_X + CROPPED_ELIXIR_WIDTH,
+    ELIXIR_START_Y + CROPPED_ELIXIR_HEIGHT,
+)
+
+
+def extract_sample(
+    image: Image, detector: ElixirDetector, frame_index: int, timestamp: float
+) -> dict[str, np.ndarray]:
+    """Crop the deck, elixir and arena regions of a capture-sized frame and label them."""
+    deck = np.asarray(image.crop(DECK_BOX))
+    cards = np.stack(
+        [deck[:, i * CARD_WIDTH : (i + 1) * CARD_WIDTH] for i in range(NUM_CARDS_ON_HAND)]
+    )
+    elixir = image.crop(ELIXIR_BOX)
+    elixir_state = detector.perform_analysis(elixir)
+
+    return {
+        "frame_index": np.int64(frame_index),
+        "timestamp": np.float64(timestamp),
+        "cards": cards,
+        "elixir": np.asarray(elixir),
+        "elixir_amount": np.int8(elixir_state.elixir_amount),
+        "arena": np.asarray(image.crop(ARENA_BOX)),
+    }
+
+
+def extract_video(
+    video: Path,
+    output_dir: Path,
+    shard_size: int,
+    stride: int,
+    fps: float | None = None,
+    max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+) -> int:
+    """Worker function: decode one recording and write its samples as keyframe-aligned shards.
+
+    Each worker buffers a single shard of at most `shard_size` samples and
+    `max_shard_bytes`. Shards end on the first keyframe once they are half
+    full. Recordings with longer keyframe intervals are cut when the buffer is
+    full instead, which the shard's `starts_on_keyframe` records.
+    """
+    detector = ElixirDetector()
+    writer = ShardWriter(
+        output_dir, source=video.name, max_shard_size=shard_size, max_shard_bytes=max_shard_bytes
+    )
+
+    container = av.open(str(video), format="h264" if video.suffix in RAW_H264_SUFFIXES else None)
+    try:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        # Raw H.264 has no timestamps, so fall back to a constant frame rate.
+        frame_rate = fps or (float(stream.average_rate) if stream.average_rate else None)
+
+        gop_start = False
+        for frame_index, frame in enumerate(container.decode(stream)):
+            if frame.key_frame:
+                gop_start = True
+                if writer.pending >= writer.capacity // 2:
+                    writer.flush()
+            if frame_index % stride:
+                continue
+
+            if frame.time is not None:
+                timestamp = float(frame.time)
+            elif frame_rate is not None:
+                timestamp = frame_index / frame_rate
+            else:
+                raise ValueError(f"{video} has no timestamps or frame rate, pass --fps.")
+
+            image = frame.reformat(
+                width=CAPTURE_WIDTH, height=CAPTURE_HEIGHT, format="rgb24"
+            ).to_image()
+            writer.append(extract_sample(image, detector, frame_index, timestamp), keyframe=gop_start)
+            gop_start = False
+    finally:
+        container.close()
+
+    return writer.close().length
+
+
+def find_videos(inputs: list[Path]) -> list[Path]:
+    videos = []
+    for path in inputs:
+        if path.is_dir():
+            videos += sorted(p for p in path.rglob("*") if p.suffix in VIDEO_SUFFIXES)
+        else:
+            videos.append(path)
+    return videos
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Extract deck, elixir and arena crops from recorded matches into a sharded dataset."
+    )
+    parser.add_argument("inputs", nargs="+", type=Path, help="Recordings or directories of recordings")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Dataset output directory")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--stride", type=int, default=1, help="Keep every n-th decoded frame")
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=None,
+        help="Frame rate used for timestamps of recordings without them (raw H.264); "
+        "defaults to the stream's average rate",
+    )
+    parser.add_argument(
+        "--max-shard-mb",
+        type=int,
+        default=DEFAULT_MAX_SHARD_BYTES // 2**20,
+        help="Largest shard, and so the memory each worker buffers",
+    )
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    videos = find_videos(args.inputs)
+    total_videos = len(videos)
+    print(f"Found {total_videos} recordings. Starting extraction...")
+    if args.fps is None and any(video.suffix in RAW_H264_SUFFIXES for video in videos):
+        print("[!] Raw H.264 has no timestamps, assuming the stream's average rate. Pass --fps to override.")
+
+    completed = 0
+    failures = 0
+    output_dirs = []
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+        future_to_dir = {}
+        for i, video in enumerate(videos):
+            output_dir = args.output / f"{i:04d}_{video.stem}"
+            future = executor.submit(
+                extract_video,
+                video,
+                output_dir,
+                args.shard_size,
+                args.stride,
+                args.fps,
+                args.max_shard_mb * 2**20,
+            )
+            future_to_dir[future] = output_dir
+
+        for future in concurrent.futures.as_completed(future_to_dir):
+            completed += 1
+            try:
+                future.result()
+                output_dirs.append(future_to_dir[future])
+            except Exception as e:
+                failures += 1
+                print(f"\n[!] Failed {future_to_dir[future]}: {e}")
+
+            # Progress bar
+            sys.stdout.write(
+                f"\rProgress: {completed}/{total_videos} (Success: {completed-failures} | Fail: {failures})"
+            )
+            sys.stdout.flush()
+
+    print("\nWriting index...")
+    args.output.mkdir(parents=True, exist_ok=True)
+    index = merge_indices(args.output, sorted(output_dirs))
+    print(f"Done! Saved {index.length} samples in {len(index.shards)} shards to {args.output}")